@@ -6,93 +6,306 @@ Supports both Maybank Credit Card and Current Account statements.
 
 import os
 import re
+import argparse
+import calendar
+import copy
 import json
 import csv
 import getpass
+import hashlib
+import mmap
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Literal
-import PyPDF2
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import List, Dict, Iterable, Iterator, NamedTuple, Optional, Literal, Sequence, Union
 from enum import Enum
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+try:
+    import pymupdf as fitz  # PyMuPDF >= 1.24.3
+except ImportError:
+    try:
+        import fitz  # Older PyMuPDF releases only provide the fitz name
+    except ImportError:
+        fitz = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class StatementType(Enum):
     CREDIT_CARD = "credit_card"
     CURRENT_ACCOUNT = "current_account"
     AUTO_DETECT = "auto_detect"
 
 
+class Transaction(NamedTuple):
+    """A single parsed transaction. Fields are in CSV column order."""
+    date: str
+    posting_date: str
+    transaction_date: str
+    description: str
+    amount: float
+    type: str
+    source_file: str
+
+
+# Credit Card regex pattern (original)
+# Matches: Posting Date + Transaction Date + Description + Amount + Optional CR
+_CREDIT_CARD_TXN_RE = re.compile(
+    r'(?P<posting>\d{2}/\d{2})\s+(?P<trans>\d{2}/\d{2})\s+(?P<desc>.+?)\s+'
+    r'(?P<amount>[\d,]+\.\d{2})(?P<cr>CR)?\s*$',
+    re.MULTILINE
+)
+
+# Current Account regex patterns
+# Pattern 1: Maybank current account format - Date + Description + Amount + Balance
+# Format: DD/MM DESCRIPTION AMOUNT+/- BALANCE
+_CURRENT_ACCOUNT_TXN_RE = re.compile(
+    r'(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2}[+-])\s+([\d,]+\.\d{2})',
+    re.MULTILINE
+)
+
+# Pattern 2: Alternative format with separate debit/credit columns
+_CURRENT_ACCOUNT_DRCR_TXN_RE = re.compile(
+    r'(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s+(DR|CR)\s+([\d,]+\.\d{2})',
+    re.MULTILINE
+)
+
+# Single current account line: DD/MM DESCRIPTION AMOUNT+/- BALANCE
+_CURRENT_ACCOUNT_LINE_RE = re.compile(r'^(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2}[+-])\s+([\d,]+\.\d{2})\s*$')
+
+# Current account detail lines following a transaction line
+_DETAIL_TEXT_LINE_RE = re.compile(r'^\s+[A-Z0-9*\s]+$')
+_DETAIL_REFERENCE_LINE_RE = re.compile(r'^\s+\d+Q?$')
+_ACCOUNT_NUMBER_RE = re.compile(r'^\d{10,}')
+_REFERENCE_CODE_RE = re.compile(r'^\d+Q$')
+_NAME_TEXT_RE = re.compile(r'^[A-Z][A-Z0-9\s*]+$')
+
+# Balance information
+_BALANCE_RE = re.compile(r'BALANCE\s+([\d,]+\.\d{2})')
+
+# Total debit amounts, in priority order (first pattern found anywhere wins)
+_TOTAL_DEBIT_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'TOTAL DEBIT\s*:\s*([\d,]+\.\d{2})',
+        r'\(JUMLAH DEBIT\)([\d,]+\.\d{2})',
+        r'TOTAL DEBIT THIS MONTH\s*\(JUMLAH DEBIT\)\s*([\d,]+\.\d{2})',
+        r'TOTAL DEBIT THIS MONTH\s+([\d,]+\.\d{2})',
+        r'JUMLAH DEBIT\s*([\d,]+\.\d{2})',
+        r'TOTAL DEBIT\s+([\d,]+\.\d{2})',
+        r'Total Debit\s+([\d,]+\.\d{2})',
+        r'DEBIT TOTAL\s+([\d,]+\.\d{2})',
+        r'Debit Total\s+([\d,]+\.\d{2})'
+    )
+]
+
+# Statement year patterns, tried in order by extract_statement_year
+# The header labels sit next to each other, so the gaps between them are bounded;
+# unbounded lazy gaps rescan the rest of the document for every stray "Statement Date"
+_STATEMENT_DATE_SECTION_RE = re.compile(
+    r'Statement Date.{0,200}?Tarikh Penyata.{0,200}?Payment Due Date.{0,200}?Tarikh Akhir Pembayaran',
+    re.IGNORECASE | re.DOTALL
+)
+_SHORT_DATE_RE = re.compile(r'(\d{1,2})\s+(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\s+(\d{2})', re.IGNORECASE)
+_DUE_DATE_YEAR_RE = re.compile(r'Payment Due Date.*?\d{1,2}\s+[A-Z]+\s+(20\d{2})', re.IGNORECASE)
+_YEAR_END_SUMMARY_RE = re.compile(r'(20\d{2})\s+Year End Summary', re.IGNORECASE)
+_STATEMENT_PERIOD_YEAR_RE = re.compile(r'Statement.*?Period.*?(20\d{2})', re.IGNORECASE)
+_PAYMENT_YEAR_RE = re.compile(r'Payment.*?(20\d{2})', re.IGNORECASE)
+_MONTH_YEAR_RE = re.compile(
+    r'(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)\s+(20\d{2})',
+    re.IGNORECASE
+)
+
+# Statement type detection indicators (plain upper-case phrases)
+_CREDIT_CARD_INDICATORS = (
+    'CREDIT CARD STATEMENT',
+    'MAYBANK CREDIT CARD',
+    'CARD NUMBER',
+    'CREDIT LIMIT',
+    'MINIMUM PAYMENT'
+)
+
+_CURRENT_ACCOUNT_INDICATORS = (
+    'ACCOUNT TRANSACTIONS',
+    'URUSNIAGA AKAUN',
+    'CURRENT ACCOUNT STATEMENT',
+    'SAVINGS ACCOUNT STATEMENT',
+    'ACCOUNT NUMBER',
+    'OPENING BALANCE',
+    'CLOSING BALANCE',
+    'BEGINNING BALANCE',
+    'STATEMENT BALANCE',
+    'CDM CASH DEPOSIT',
+    'TRANSFER TO A/C'
+)
+
+# The statement type is declared in the first page header, so score this many
+# leading characters before falling back to the whole document
+_DETECTION_HEADER_CHARS = 4096
+
+# Descriptions containing any of these (upper-case) are not transactions.
+# Matched against the upper-cased description: an IGNORECASE pattern is
+# several times slower in re than upper() plus a case-sensitive search.
+_SKIP_KEYWORDS = (
+    'BALANCE', 'LIMIT', 'STATEMENT', 'PREVIOUS', 'CURRENT', 'MINIMUM',
+    'RETAIL INTEREST RATE', 'YOUR COMBINED', 'KOMBINASI HAD',
+    'JUMLAH PENYATA', 'TRANSACTED AMOUNT', 'USD', 'FOREIGN EXCHANGE'
+)
+_SKIP_KEYWORDS_RE = re.compile('|'.join(re.escape(keyword) for keyword in _SKIP_KEYWORDS))
+
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@lru_cache(maxsize=4096)
+def _format_statement_date(date_str: str, year: int) -> str:
+    """
+    Format a Maybank DD/MM date in the given year as YYYY-MM-DD, returning
+    date_str unchanged when it is not a valid date.
+    """
+    try:
+        day, month = map(int, date_str.split('/'))
+    except ValueError:
+        return date_str
+    
+    # Validate by hand rather than constructing a datetime just to check the day
+    if not 1 <= month <= 12:
+        return date_str
+    days_in_month = 29 if month == 2 and calendar.isleap(year) else _DAYS_IN_MONTH[month - 1]
+    if not 1 <= day <= days_in_month:
+        return date_str
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def _infer_statement_date(date_str: str, now: datetime) -> str:
+    """
+    Format a Maybank DD/MM date without a statement year, assuming the current
+    year unless that puts the date more than 6 months after now.
+    """
+    try:
+        # Extract month and day
+        day, month = map(int, date_str.split('/'))
+        
+        target_year = now.year
+        try:
+            date_obj = datetime(target_year, month, day)
+            if (date_obj - now).days > 180:
+                target_year = target_year - 1
+        except ValueError:
+            # Invalid date, use previous year
+            target_year = target_year - 1
+    except Exception:
+        return date_str
+    
+    return _format_statement_date(date_str, target_year)
+
+
+@lru_cache(maxsize=512)
+def _infer_statement_date_cached(date_str: str, now: datetime) -> str:
+    """
+    Memoised _infer_statement_date, for callers that reuse one clock reading.
+    """
+    return _infer_statement_date(date_str, now)
+
+
+def _parse_amount(amount: str) -> float:
+    """
+    Parse a regex-validated amount such as '1,234.56'. The thousands separator
+    is only stripped when present, so the common small amount goes straight to float().
+    """
+    return float(amount.replace(',', '')) if ',' in amount else float(amount)
+
+
+class _WorkerConfig(NamedTuple):
+    """Settings a worker process needs to rebuild a parser for one file."""
+    statement_type: StatementType
+    backend: str
+    cache_dir: Optional[str]
+    now: Optional[datetime]
+    passwords: Dict[str, str]  # Snapshot of password_cache, never mutated
+    common_password: Optional[str]  # Set only when one password is used for all PDFs
+
+
+class _PasswordRequired(Exception):
+    """Raised by a non-interactive parser when a PDF needs a password it does not have."""
+
+
 class MaybankStatementParser:
-    def __init__(self, pdf_folder: str = "./Drop", statement_type: StatementType = StatementType.CREDIT_CARD):
+    def __init__(self, pdf_folder: Union[str, os.PathLike] = "./Drop", statement_type: StatementType = StatementType.CREDIT_CARD,
+                 backend: Optional[Literal["pypdfium2", "pymupdf", "pypdf2"]] = None, max_workers: Optional[int] = None,
+                 cache_dir: Optional[str] = None):
         self.pdf_folder = pdf_folder
         self.statement_type = statement_type
+        self.max_workers = max_workers  # Worker processes for batch runs (None = CPU count)
+        # Extracted text cache, keyed by file content. Off by default because the
+        # cached text is the decrypted statement.
+        self.cache_dir = cache_dir
+        self.interactive = True  # False in worker processes, which cannot prompt for passwords
+        self._password_owner = None  # Parser whose password state a prefetch copy shares
+        self._messages = None  # Per-file messages are buffered here instead of printed when set
+        
+        # PDF text extraction backend - pypdfium2 (PDFium) and PyMuPDF (MuPDF) are C/C++
+        # engines and much faster than the pure-Python PyPDF2, which is kept as a fallback.
+        # Without an explicit choice the first installed one in that order is used.
+        installed_backends = {"pypdfium2": pdfium, "pymupdf": fitz, "pypdf2": PyPDF2}
+        if backend is None:
+            backend = next((name for name, module in installed_backends.items() if module is not None), None)
+            if backend is None:
+                raise ImportError("No PDF backend installed - install pypdfium2, PyMuPDF or PyPDF2")
+        elif backend not in installed_backends:
+            raise ValueError(f"Unknown PDF backend '{backend}' - use pypdfium2, pymupdf or pypdf2")
+        elif installed_backends[backend] is None:
+            raise ImportError(f"PDF backend '{backend}' is not installed")
+        self.backend = backend
         self.validation_results = []  # Track validation results
         self.password_cache = {}  # Cache passwords for files
         self.use_same_password = None  # User preference for password handling
         self.common_password = None  # Common password if user chooses same for all
+        self._now = None  # Clock reading shared by a whole batch run
         
-        # Credit Card regex pattern (original)
-        # Matches: Posting Date + Transaction Date + Description + Amount + Optional CR
-        self.credit_card_pattern = re.compile(
-            r'(\d{2}/\d{2})\s+(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})(CR)?\s*$', 
-            re.MULTILINE
-        )
-        
-        # Current Account regex patterns
-        # Pattern 1: Maybank current account format - Date + Description + Amount + Balance
-        # Format: DD/MM DESCRIPTION AMOUNT+/- BALANCE
-        self.current_account_pattern1 = re.compile(
-            r'(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2}[+-])\s+([\d,]+\.\d{2})',
-            re.MULTILINE
-        )
-        
-        # Pattern 2: Alternative format with separate debit/credit columns
-        self.current_account_pattern2 = re.compile(
-            r'(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s+(DR|CR)\s+([\d,]+\.\d{2})',
-            re.MULTILINE
-        )
+        # Transaction patterns are compiled once at module level
+        self.credit_card_pattern = _CREDIT_CARD_TXN_RE
+        self.current_account_pattern1 = _CURRENT_ACCOUNT_TXN_RE
+        self.current_account_pattern2 = _CURRENT_ACCOUNT_DRCR_TXN_RE
         
         # Pattern for balance information
-        self.balance_pattern = re.compile(r'BALANCE\s+([\d,]+\.\d{2})')
-        
-        # Statement type detection patterns
-        self.credit_card_indicators = [
-            r'CREDIT CARD STATEMENT',
-            r'MAYBANK CREDIT CARD',
-            r'CARD NUMBER',
-            r'CREDIT LIMIT',
-            r'MINIMUM PAYMENT'
-        ]
+        self.balance_pattern = _BALANCE_RE
         
-        self.current_account_indicators = [
-            r'ACCOUNT TRANSACTIONS',
-            r'URUSNIAGA AKAUN',
-            r'CURRENT ACCOUNT STATEMENT',
-            r'SAVINGS ACCOUNT STATEMENT', 
-            r'ACCOUNT NUMBER',
-            r'OPENING BALANCE',
-            r'CLOSING BALANCE',
-            r'BEGINNING BALANCE',
-            r'STATEMENT BALANCE',
-            r'CDM CASH DEPOSIT',
-            r'TRANSFER TO A/C'
-        ]
+        # Statement type detection indicators
+        self.credit_card_indicators = _CREDIT_CARD_INDICATORS
+        self.current_account_indicators = _CURRENT_ACCOUNT_INDICATORS
         
 
     
+    def _score_indicators(self, text: str):
+        """Count the credit card and current account indicators present in text."""
+        # Indicators are plain phrases, so a substring test is enough (and faster than regex)
+        text_upper = text.upper()
+        credit_card_score = sum(1 for indicator in self.credit_card_indicators if indicator in text_upper)
+        current_account_score = sum(1 for indicator in self.current_account_indicators if indicator in text_upper)
+        return credit_card_score, current_account_score
+    
     def detect_statement_type(self, text: str) -> StatementType:
         """Detect whether the PDF is a credit card or current account statement."""
-        text_upper = text.upper()
+        credit_card_score, current_account_score = self._score_indicators(text[:_DETECTION_HEADER_CHARS])
         
-        credit_card_score = 0
-        current_account_score = 0
-        
-        # Check for credit card indicators
-        for indicator in self.credit_card_indicators:
-            if re.search(indicator, text_upper):
-                credit_card_score += 1
-        
-        for indicator in self.current_account_indicators:
-            if re.search(indicator, text_upper):
-                current_account_score += 1
+        # Only a one-sided header is conclusive; otherwise score the whole text
+        conclusive = min(credit_card_score, current_account_score) == 0 and max(credit_card_score, current_account_score) >= 2
+        if not conclusive and len(text) > _DETECTION_HEADER_CHARS:
+            credit_card_score, current_account_score = self._score_indicators(text)
         
         if credit_card_score > current_account_score:
             return StatementType.CREDIT_CARD
@@ -103,76 +316,260 @@ class MaybankStatementParser:
             print("⚠️  Could not clearly detect statement type, defaulting to credit card")
             return StatementType.CREDIT_CARD
         
-    def extract_text_from_pdf(self, pdf_path: str) -> Optional[str]:
+    def extract_text_from_pdf(self, pdf_path: Union[str, os.PathLike], pages: Optional[Sequence[int]] = None) -> Optional[str]:
         """
         Extract text from a PDF file with error handling and password support.
+        Pass zero-based page indices in pages to extract only those pages.
+        """
+        pdf_path = os.fspath(pdf_path)
+        # Only whole documents are cached
+        cache_path = self._text_cache_path(pdf_path) if self.cache_dir and pages is None else None
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as cache_file:
+                return cache_file.read()
+        
+        if self.backend == "pypdfium2":
+            text = self._extract_text_pdfium(pdf_path, pages)
+        elif self.backend == "pymupdf":
+            text = self._extract_text_pymupdf(pdf_path, pages)
+        else:
+            text = self._extract_text_pypdf2(pdf_path, pages)
+        
+        if cache_path and text:
+            self._write_text_cache(cache_path, text)
+        return text
+
+    def _report(self, message: str):
+        """
+        Print a per-file message, or buffer it while working off the main
+        thread or in a worker process so the caller can print it in file order.
         """
+        if self._messages is None:
+            print(message)
+        else:
+            self._messages.append(message)
+
+    def _extract_text_buffered(self, pdf_path: str):
+        """
+        Extract text with messages buffered rather than printed.
+        Returns (text, messages).
+        """
+        self._messages = []
         try:
+            text = self.extract_text_from_pdf(pdf_path)
+            return text, self._messages
+        finally:
+            self._messages = None
+
+    def _text_cache_path(self, pdf_path: str) -> Optional[str]:
+        """
+        Build the cache file path for a PDF from a hash of its bytes and the backend.
+        """
+        try:
+            digest = hashlib.blake2b(digest_size=16)
             with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
+                for chunk in iter(lambda: file.read(1 << 20), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        key = f"{digest.hexdigest()}-{os.path.getsize(pdf_path)}-{self.backend}"
+        return os.path.join(self.cache_dir, f"{key}.txt")
+
+    def _write_text_cache(self, cache_path: str, text: str):
+        """
+        Write extracted text to the cache atomically so concurrent workers never see partial files.
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+                    tmp_file.write(text)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            self._report(f"⚠️  Could not write text cache for {os.path.basename(cache_path)}: {e}")
+
+    def _extract_text_pdfium(self, pdf_path: str, pages: Optional[Sequence[int]] = None) -> Optional[str]:
+        """
+        Extract text using pypdfium2. PDFium tries the empty password on its own,
+        so a password error here means the user has to supply one.
+        """
+        filename = os.path.basename(pdf_path)
+        pdf = None
+        try:
+            try:
+                pdf = pdfium.PdfDocument(pdf_path)
+            except pdfium.PdfiumError as e:
+                if 'password' not in str(e).lower():
+                    raise
+                self._report(f"🔒 Encrypted PDF detected: {filename}")
+
+                max_password_attempts = 3
+                for attempt in range(max_password_attempts):
+                    password = self._get_password_for_file(pdf_path, attempt)
+                    if password is None:
+                        self._report(f"❌ No password provided for encrypted PDF: {pdf_path}")
+                        return None
+
+                    try:
+                        pdf = pdfium.PdfDocument(pdf_path, password=password)
+                        self._report(f"✅ Successfully decrypted PDF: {filename}")
+                        break
+                    except pdfium.PdfiumError:
+                        self._report(f"❌ Failed to decrypt PDF: {filename} - Incorrect password (attempt {attempt + 1}/{max_password_attempts})")
+                        self._forget_password(pdf_path)
+                        if attempt == max_password_attempts - 1:
+                            self._report(f"❌ Maximum password attempts exceeded for {filename}")
+                            return None
+
+            page_texts = []
+            for page_index in (pages if pages is not None else range(len(pdf))):
+                try:
+                    # PDFium reports line breaks as CRLF
+                    page_texts.append(pdf[page_index].get_textpage().get_text_bounded().replace('\r\n', '\n'))
+                except Exception as e:
+                    continue
+            return '\n'.join(page_texts) + '\n' if page_texts else ''
+        except FileNotFoundError:
+            self._report(f"❌ File not found: {pdf_path}")
+            return None
+        except _PasswordRequired:
+            raise
+        except Exception as e:
+            self._report(f"❌ Error reading PDF {pdf_path}: {e}")
+            return None
+        finally:
+            if pdf is not None:
+                pdf.close()
+
+    def _extract_text_pymupdf(self, pdf_path: str, pages: Optional[Sequence[int]] = None) -> Optional[str]:
+        """
+        Extract text using PyMuPDF.
+        """
+        filename = os.path.basename(pdf_path)
+        doc = None
+        try:
+            doc = fitz.open(pdf_path)
+            
+            # authenticate() returns 0 on failure, non-zero on success
+            if doc.needs_pass:
+                self._report(f"🔒 Encrypted PDF detected: {filename}")
+                
+                # First try empty password (some Maybank PDFs use this)
+                if doc.authenticate(""):
+                    self._report(f"✅ Successfully decrypted PDF with empty password: {filename}")
+                else:
+                    max_password_attempts = 3
+                    for attempt in range(max_password_attempts):
+                        password = self._get_password_for_file(pdf_path, attempt)
+                        if password is None:
+                            self._report(f"❌ No password provided for encrypted PDF: {pdf_path}")
+                            return None
+                        
+                        if doc.authenticate(password):
+                            self._report(f"✅ Successfully decrypted PDF: {filename}")
+                            break
+                        
+                        self._report(f"❌ Failed to decrypt PDF: {filename} - Incorrect password (attempt {attempt + 1}/{max_password_attempts})")
+                        self._forget_password(pdf_path)
+                        if attempt == max_password_attempts - 1:
+                            self._report(f"❌ Maximum password attempts exceeded for {filename}")
+                            return None
+            
+            page_texts = []
+            for page_index in (pages if pages is not None else range(doc.page_count)):
+                try:
+                    page_texts.append(doc[page_index].get_text("text"))
+                except Exception as e:
+                    continue
+            return '\n'.join(page_texts) + '\n' if page_texts else ''
+        except FileNotFoundError:
+            self._report(f"❌ File not found: {pdf_path}")
+            return None
+        except _PasswordRequired:
+            raise
+        except Exception as e:
+            self._report(f"❌ Error reading PDF {pdf_path}: {e}")
+            return None
+        finally:
+            if doc is not None:
+                doc.close()
+
+    def _extract_text_pypdf2(self, pdf_path: str, pages: Optional[Sequence[int]] = None) -> Optional[str]:
+        """
+        Extract text using PyPDF2 (fallback backend).
+        """
+        try:
+            # Map the file instead of reading it; PyPDF2 only needs read/seek/tell
+            with open(pdf_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                reader = PyPDF2.PdfReader(mapped)
                 
                 # Check if PDF is encrypted
                 if reader.is_encrypted:
-                    print(f"🔒 Encrypted PDF detected: {os.path.basename(pdf_path)}")
+                    self._report(f"🔒 Encrypted PDF detected: {os.path.basename(pdf_path)}")
                     
                     # First try empty password (some Maybank PDFs use this)
                     try:
                         empty_result = reader.decrypt("")
                         if empty_result > 0:
-                            print(f"✅ Successfully decrypted PDF with empty password: {os.path.basename(pdf_path)}")
+                            self._report(f"✅ Successfully decrypted PDF with empty password: {os.path.basename(pdf_path)}")
                         else:
                             # Empty password failed, try with user-provided password
                             max_password_attempts = 3
                             for attempt in range(max_password_attempts):
                                 password = self._get_password_for_file(pdf_path, attempt)
                                 if password is None:
-                                    print(f"❌ No password provided for encrypted PDF: {pdf_path}")
+                                    self._report(f"❌ No password provided for encrypted PDF: {pdf_path}")
                                     return None
                                 
                                 try:
                                     decrypt_result = reader.decrypt(password)
                                     if decrypt_result == 0:
-                                        print(f"❌ Failed to decrypt PDF: {os.path.basename(pdf_path)} - Incorrect password (attempt {attempt + 1}/{max_password_attempts})")
-                                        # Clear the cached password so user can try again
-                                        filename = os.path.basename(pdf_path)
-                                        if filename in self.password_cache:
-                                            del self.password_cache[filename]
-                                        # If using same password for all, clear that too
-                                        if self.use_same_password:
-                                            self.common_password = None
-                                        
+                                        self._report(f"❌ Failed to decrypt PDF: {os.path.basename(pdf_path)} - Incorrect password (attempt {attempt + 1}/{max_password_attempts})")
+                                        self._forget_password(pdf_path)
+
                                         # If this was the last attempt, return None
                                         if attempt == max_password_attempts - 1:
-                                            print(f"❌ Maximum password attempts exceeded for {os.path.basename(pdf_path)}")
+                                            self._report(f"❌ Maximum password attempts exceeded for {os.path.basename(pdf_path)}")
                                             return None
                                         # Otherwise, continue to next attempt
                                         continue
                                     elif decrypt_result == 1:
-                                        print(f"✅ Successfully decrypted PDF: {os.path.basename(pdf_path)}")
+                                        self._report(f"✅ Successfully decrypted PDF: {os.path.basename(pdf_path)}")
                                         break
                                     elif decrypt_result == 2:
-                                        print(f"✅ Successfully decrypted PDF with owner password: {os.path.basename(pdf_path)}")
+                                        self._report(f"✅ Successfully decrypted PDF with owner password: {os.path.basename(pdf_path)}")
                                         break
                                 except Exception as e:
-                                    print(f"❌ Error during decryption of {os.path.basename(pdf_path)}: {e}")
+                                    self._report(f"❌ Error during decryption of {os.path.basename(pdf_path)}: {e}")
                                     if attempt == max_password_attempts - 1:
                                         return None
+                    except _PasswordRequired:
+                        raise
                     except Exception as e:
-                        print(f"❌ Error trying empty password for {os.path.basename(pdf_path)}: {e}")
+                        self._report(f"❌ Error trying empty password for {os.path.basename(pdf_path)}: {e}")
                         return None
                 
-                text = ''
-                for page_num, page in enumerate(reader.pages):
+                page_texts = []
+                for page_num in (pages if pages is not None else range(len(reader.pages))):
                     try:
-                        text += page.extract_text() + '\n'
+                        page_texts.append(reader.pages[page_num].extract_text())
                     except Exception as e:
                         continue
-                return text
+                return '\n'.join(page_texts) + '\n' if page_texts else ''
         except FileNotFoundError:
-            print(f"❌ File not found: {pdf_path}")
+            self._report(f"❌ File not found: {pdf_path}")
             return None
+        except _PasswordRequired:
+            raise
         except Exception as e:
-            print(f"❌ Error reading PDF {pdf_path}: {e}")
+            self._report(f"❌ Error reading PDF {pdf_path}: {e}")
             return None
     
     def extract_statement_year(self, text: str) -> Optional[int]:
@@ -183,38 +580,38 @@ class MaybankStatementParser:
         try:
             # Look for Statement Date section followed by date pattern like "08 JUN 24"
             # The date appears after "Statement Date/Tarikh Penyata Payment Due Date/Tarikh Akhir Pembayaran"
-            statement_section = re.search(r'Statement Date.*?Tarikh Penyata.*?Payment Due Date.*?Tarikh Akhir Pembayaran', text, re.IGNORECASE | re.DOTALL)
+            statement_section = _STATEMENT_DATE_SECTION_RE.search(text)
             if statement_section:
                 # Look for the first date pattern after the statement section
                 remaining_text = text[statement_section.end():statement_section.end() + 200]  # Look in next 200 chars
-                date_pattern = re.search(r'(\d{1,2})\s+(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\s+(\d{2})', remaining_text, re.IGNORECASE)
+                date_pattern = _SHORT_DATE_RE.search(remaining_text)
                 if date_pattern:
                     year_2digit = int(date_pattern.group(3))
                     # Convert 2-digit year to 4-digit (assuming 20xx for years 00-99)
                     return 2000 + year_2digit
             
             # Look for payment due date patterns like "Payment Due Date / Tarikh Bayaran Perlu Dijelaskan 28 JANUARY 2024"
-            due_date_pattern = re.search(r'Payment Due Date.*?\d{1,2}\s+[A-Z]+\s+(20\d{2})', text, re.IGNORECASE)
+            due_date_pattern = _DUE_DATE_YEAR_RE.search(text)
             if due_date_pattern:
                 return int(due_date_pattern.group(1))
             
             # Look for year-end summary patterns like "2024 Year End Summary"
-            year_summary_pattern = re.search(r'(20\d{2})\s+Year End Summary', text, re.IGNORECASE)
+            year_summary_pattern = _YEAR_END_SUMMARY_RE.search(text)
             if year_summary_pattern:
                 return int(year_summary_pattern.group(1))
             
             # Look for statement period patterns
-            period_pattern = re.search(r'Statement.*?Period.*?(20\d{2})', text, re.IGNORECASE)
+            period_pattern = _STATEMENT_PERIOD_YEAR_RE.search(text)
             if period_pattern:
                 return int(period_pattern.group(1))
             
             # Look for any 4-digit year in payment context
-            payment_year_pattern = re.search(r'Payment.*?(20\d{2})', text, re.IGNORECASE)
+            payment_year_pattern = _PAYMENT_YEAR_RE.search(text)
             if payment_year_pattern:
                 return int(payment_year_pattern.group(1))
             
             # Simple fallback - look for JANUARY/FEBRUARY etc followed by year
-            month_year_pattern = re.search(r'(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)\s+(20\d{2})', text, re.IGNORECASE)
+            month_year_pattern = _MONTH_YEAR_RE.search(text)
             if month_year_pattern:
                 return int(month_year_pattern.group(2))
                 
@@ -222,59 +619,39 @@ class MaybankStatementParser:
         except Exception as e:
             return None
     
-    def parse_date_maybank(self, date_str: str, statement_year: int = None) -> str:
+    def _current_time(self) -> datetime:
+        """Return the batch run's clock reading, or the current time outside a run."""
+        return self._now or datetime.now()
+    
+    def parse_date_maybank(self, date_str: str, statement_year: int = None, now: Optional[datetime] = None) -> str:
         """
         Parse Maybank date format (DD/MM) and add appropriate year.
         Uses statement year from PDF content if available, otherwise uses current year logic.
+        Callers parsing many dates can pass now to avoid reading the clock on every call.
         """
-        try:
-            # Extract month and day
-            day, month = map(int, date_str.split('/'))
-            
-            # Use statement year if provided, otherwise use current year logic
-            if statement_year:
-                target_year = statement_year
-            else:
-                current_date = datetime.now()
-                target_year = current_date.year
-                # If the date is more than 6 months in the future, use previous year
-                try:
-                    date_obj = datetime(target_year, month, day)
-                    if (date_obj - current_date).days > 180:
-                        target_year = target_year - 1
-                except ValueError:
-                    # Invalid date, use previous year
-                    target_year = target_year - 1
-            
-            # Create final date object
-            date_obj = datetime(target_year, month, day)
-            return date_obj.strftime('%Y-%m-%d')
-        except Exception:
-            return date_str
+        # The result depends only on the inputs, so it is memoised unless the clock is read afresh
+        if statement_year:
+            return _format_statement_date(date_str, statement_year)
+        if now is None and self._now is None:
+            # A fresh clock reading would never be seen again, so skip the cache
+            return _infer_statement_date(date_str, datetime.now())
+        return _infer_statement_date_cached(date_str, now or self._now)
     
     def clean_description(self, description: str) -> str:
         """
         Clean and normalize transaction description.
         """
-        # Remove extra whitespace and normalize
-        cleaned = ' '.join(description.split())
-        return cleaned.strip()
+        # Remove extra whitespace and normalize (split() already drops leading/trailing whitespace)
+        return ' '.join(description.split())
     
     def is_valid_transaction(self, description: str) -> bool:
         """
         Check if the description represents a valid transaction.
         """
         # Skip non-transaction lines
-        skip_keywords = [
-            'BALANCE', 'LIMIT', 'STATEMENT', 'PREVIOUS', 'CURRENT', 'MINIMUM',
-            'RETAIL INTEREST RATE', 'YOUR COMBINED', 'KOMBINASI HAD',
-            'JUMLAH PENYATA', 'TRANSACTED AMOUNT', 'USD', 'FOREIGN EXCHANGE'
-        ]
-        
-        description_upper = description.upper()
-        return not any(keyword in description_upper for keyword in skip_keywords)
+        return _SKIP_KEYWORDS_RE.search(description.upper()) is None
     
-    def parse_transactions(self, text: str, filename: str) -> List[Dict]:
+    def parse_transactions(self, text: str, filename: str) -> List[Transaction]:
         """
         Parse transactions from extracted text based on statement type.
         """
@@ -290,37 +667,52 @@ class MaybankStatementParser:
         elif self.statement_type == StatementType.CURRENT_ACCOUNT:
             transactions = self._parse_current_account_transactions(text, filename, statement_year, seen_transactions)
         else:
-            print(f"⚠️  Unknown statement format detected in {filename}. Please check the file manually.")
+            self._report(f"⚠️  Unknown statement format detected in {filename}. Please check the file manually.")
             return []
         
         return transactions
     
-    def _parse_credit_card_transactions(self, text: str, filename: str, statement_year: int, seen_transactions: set) -> List[Dict]:
+    def _parse_credit_card_transactions(self, text: str, filename: str, statement_year: int, seen_transactions: set) -> List[Transaction]:
         """
         Parse credit card transactions using the original pattern.
         """
         transactions = []
-        matches = self.credit_card_pattern.findall(text)
+        found_match = False
         
-        if not matches:
-            print(f"⚠️  No credit card transactions found in {filename}. Format may be unexpected.")
+        # Only needed to infer the year, and read once rather than per date
+        now = None if statement_year else self._current_time()
+        # Posting and transaction dates repeat heavily, so parse each distinct DD/MM once
+        date_cache = {}
         
-        for match in matches:
+        # Bind per-match helpers to locals once rather than looking them up on every iteration
+        clean_description = self.clean_description
+        is_valid_transaction = self.is_valid_transaction
+        parse_date = self.parse_date_maybank
+        seen_add = seen_transactions.add
+        append_transaction = transactions.append
+        
+        # Stream matches lazily instead of materialising every tuple up front
+        for match in self.credit_card_pattern.finditer(text):
+            found_match = True
             try:
-                posting_date, transaction_date, description, amount, cr_flag = match
+                posting_date = match.group('posting')
+                transaction_date = match.group('trans')
+                description = match.group('desc')
+                amount = match.group('amount')
+                cr_flag = match.group('cr')
                 
                 # Clean and validate description
-                description = self.clean_description(description)
+                description = clean_description(description)
                 if not description or len(description) < 3:
                     continue
                 
                 # Skip non-transaction lines
-                if not self.is_valid_transaction(description):
+                if not is_valid_transaction(description):
                     continue
                 
                 # Parse amount (remove commas first)
                 try:
-                    amount_float = float(amount.replace(',', ''))
+                    amount_float = _parse_amount(amount)
                 except ValueError:
                     continue
                 
@@ -328,46 +720,55 @@ class MaybankStatementParser:
                 transaction_type = 'CREDIT' if cr_flag == 'CR' else 'DEBIT'
                 
                 # Parse dates using statement year from PDF content
-                parsed_posting_date = self.parse_date_maybank(posting_date, statement_year)
-                parsed_transaction_date = self.parse_date_maybank(transaction_date, statement_year)
+                parsed_posting_date = date_cache.get(posting_date)
+                if parsed_posting_date is None:
+                    parsed_posting_date = date_cache[posting_date] = parse_date(posting_date, statement_year, now)
+                parsed_transaction_date = date_cache.get(transaction_date)
+                if parsed_transaction_date is None:
+                    parsed_transaction_date = date_cache[transaction_date] = parse_date(transaction_date, statement_year, now)
                 
                 # Create unique identifier to avoid duplicates
-                transaction_id = f"{transaction_date}_{description}_{amount}"
+                transaction_id = (transaction_date, description, amount)
                 if transaction_id in seen_transactions:
                     continue
-                seen_transactions.add(transaction_id)
+                seen_add(transaction_id)
                 
-                transaction = {
-                    'date': parsed_transaction_date,
-                    'posting_date': parsed_posting_date,
-                    'transaction_date': parsed_transaction_date,
-                    'description': description,
-                    'amount': amount_float,
-                    'type': transaction_type,
-                    'source_file': filename
-                }
+                transaction = Transaction(
+                    date=parsed_transaction_date,
+                    posting_date=parsed_posting_date,
+                    transaction_date=parsed_transaction_date,
+                    description=description,
+                    amount=amount_float,
+                    type=transaction_type,
+                    source_file=filename
+                )
                 
-                transactions.append(transaction)
+                append_transaction(transaction)
                 
             except Exception as e:
                     continue
         
+        if not found_match:
+            self._report(f"⚠️  No credit card transactions found in {filename}. Format may be unexpected.")
+        
         return transactions
     
-    def _parse_current_account_transactions(self, text: str, filename: str, statement_year: int, seen_transactions: set) -> List[Dict]:
+    def _parse_current_account_transactions(self, text: str, filename: str, statement_year: int, seen_transactions: set) -> List[Transaction]:
         """
         Parse current account transactions with multi-line descriptions.
         """
         transactions = []
         lines = text.split('\n')
         
-        # Main transaction pattern: DD/MM DESCRIPTION AMOUNT+/- BALANCE
-        transaction_pattern = re.compile(r'^(\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2}[+-])\s+([\d,]+\.\d{2})\s*$')
+        # Strip and classify every line once; header_matches[i] is the
+        # DD/MM DESCRIPTION AMOUNT+/- BALANCE match for line i, or None
+        stripped = [line.strip() for line in lines]
+        header_matches = [_CURRENT_ACCOUNT_LINE_RE.match(line) for line in stripped]
+        line_count = len(lines)
         
         i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            match = transaction_pattern.match(line)
+        while i < line_count:
+            match = header_matches[i]
             
             if match:
                 try:
@@ -379,21 +780,21 @@ class MaybankStatementParser:
                     
                     # Look ahead for detail lines (lines that start with spaces or specific patterns)
                     j = i + 1
-                    while j < len(lines):
-                        next_line = lines[j]
+                    while j < line_count:
+                        next_stripped = stripped[j]
                         # Stop if we hit another transaction or empty line
-                        if (transaction_pattern.match(next_line.strip()) or 
-                            not next_line.strip() or
-                            next_line.strip().startswith('BEGINNING BALANCE') or
-                            next_line.strip().startswith('ENDING BALANCE')):
+                        if (header_matches[j] or
+                            not next_stripped or
+                            next_stripped.startswith(('BEGINNING BALANCE', 'ENDING BALANCE'))):
                             break
                         
                         # Collect detail lines (usually indented or contain specific info)
+                        next_line = lines[j]
                         if (next_line.startswith('   ') or 
-                            re.match(r'^\s+[A-Z0-9*\s]+$', next_line) or
+                            _DETAIL_TEXT_LINE_RE.match(next_line) or
                             'DUITNOW' in next_line or
-                            re.match(r'^\s+\d+Q?$', next_line)):
-                            detail_lines.append(next_line.strip())
+                            _DETAIL_REFERENCE_LINE_RE.match(next_line)):
+                            detail_lines.append(next_stripped)
                         j += 1
                     
                     # Combine description with details
@@ -403,9 +804,9 @@ class MaybankStatementParser:
                         for detail in detail_lines:
                             if (detail and detail != '*' and len(detail) > 1):
                                 # Keep account numbers (long numeric strings) and other meaningful text
-                                if (re.match(r'^\d{10,}', detail) or  # Account numbers (10+ digits)
-                                    re.match(r'^\d+Q$', detail) or      # Reference codes ending with Q
-                                    re.match(r'^[A-Z][A-Z0-9\s*]+$', detail) or  # Names and text
+                                if (_ACCOUNT_NUMBER_RE.match(detail) or  # Account numbers (10+ digits)
+                                    _REFERENCE_CODE_RE.match(detail) or  # Reference codes ending with Q
+                                    _NAME_TEXT_RE.match(detail) or  # Names and text
                                     'DUITNOW' in detail or
                                     len(detail) > 3):  # Other meaningful text
                                     meaningful_details.append(detail)
@@ -430,14 +831,14 @@ class MaybankStatementParser:
                     
                     if amount_with_sign.endswith('+'):
                         try:
-                            amount_float = float(amount_with_sign[:-1].replace(',', ''))
+                            amount_float = _parse_amount(amount_with_sign[:-1])
                             transaction_type = 'CREDIT'
                         except ValueError:
                             i = j
                             continue
                     elif amount_with_sign.endswith('-'):
                         try:
-                            amount_float = float(amount_with_sign[:-1].replace(',', ''))
+                            amount_float = _parse_amount(amount_with_sign[:-1])
                             transaction_type = 'DEBIT'
                         except ValueError:
                             i = j
@@ -451,22 +852,21 @@ class MaybankStatementParser:
                     
                     # Create unique identifier to avoid duplicates
                     # Include detail lines and balance to distinguish between similar transactions
-                    detail_summary = '|'.join(detail_lines[:3]) if detail_lines else ''
-                    transaction_id = f"{date_str}_{full_description}_{amount_float}_{detail_summary}_{balance_str}"
+                    transaction_id = (date_str, full_description, amount_float, tuple(detail_lines[:3]), balance_str)
                     if transaction_id in seen_transactions:
                         i = j
                         continue
                     seen_transactions.add(transaction_id)
                     
-                    transaction = {
-                        'date': parsed_date,
-                        'posting_date': parsed_date,
-                        'transaction_date': parsed_date,
-                        'description': full_description,
-                        'amount': amount_float,
-                        'type': transaction_type,
-                        'source_file': filename
-                    }
+                    transaction = Transaction(
+                        date=parsed_date,
+                        posting_date=parsed_date,
+                        transaction_date=parsed_date,
+                        description=full_description,
+                        amount=amount_float,
+                        type=transaction_type,
+                        source_file=filename
+                    )
                     
                     transactions.append(transaction)
                     i = j
@@ -487,7 +887,7 @@ class MaybankStatementParser:
             # Handle DD/MM format
             if '/' in date_str and len(date_str.split('/')) == 2:
                 day, month = date_str.split('/')
-                year = statement_year or datetime.now().year
+                year = statement_year or self._current_time().year
                 date_obj = datetime(year, int(month), int(day))
                 return date_obj.strftime('%Y-%m-%d')
             # Handle DD/MM/YYYY format (fallback)
@@ -516,21 +916,8 @@ class MaybankStatementParser:
         Extract total debit amount from the statement for validation.
         Looks for "TOTAL DEBIT : amount" and similar patterns.
         """
-        # Pattern to match total debit amounts
-        total_patterns = [
-            r'TOTAL DEBIT\s*:\s*([\d,]+\.\d{2})',
-            r'\(JUMLAH DEBIT\)([\d,]+\.\d{2})',
-            r'TOTAL DEBIT THIS MONTH\s*\(JUMLAH DEBIT\)\s*([\d,]+\.\d{2})',
-            r'TOTAL DEBIT THIS MONTH\s+([\d,]+\.\d{2})',
-            r'JUMLAH DEBIT\s*([\d,]+\.\d{2})',
-            r'TOTAL DEBIT\s+([\d,]+\.\d{2})',
-            r'Total Debit\s+([\d,]+\.\d{2})',
-            r'DEBIT TOTAL\s+([\d,]+\.\d{2})',
-            r'Debit Total\s+([\d,]+\.\d{2})'
-        ]
-        
-        for pattern in total_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _TOTAL_DEBIT_RES:
+            match = pattern.search(text)
             if match:
                 try:
                     # Remove commas and convert to float
@@ -541,16 +928,20 @@ class MaybankStatementParser:
         
         return None
     
-    def validate_debit_transactions(self, transactions: List[Dict], text: str, filename: str) -> bool:
+    def validate_debit_transactions(self, transactions: List[Transaction], text: str, filename: str) -> bool:
         """
         Validate debit transactions for the month.
         Compares the sum of parsed debit transactions against the PDF total debit amount.
         """
-        # Calculate sum of debit transactions
-        debit_transactions = [t for t in transactions if t['type'] == 'DEBIT']
-        calculated_debit_sum = sum(t['amount'] for t in debit_transactions)
+        # Calculate sum and count of debit transactions in one pass
+        calculated_debit_sum = 0
+        debit_count = 0
+        for transaction in transactions:
+            if transaction.type == 'DEBIT':
+                calculated_debit_sum += transaction.amount
+                debit_count += 1
         
-        if not debit_transactions:
+        if not debit_count:
             self.validation_results.append({
                 'filename': filename,
                 'status': 'NO_DEBITS',
@@ -579,8 +970,8 @@ class MaybankStatementParser:
             })
             
             if not is_valid:
-                print(f"✗ Validation failed: {filename} - Expected RM{pdf_total_debit:.2f}, got RM{calculated_debit_sum:.2f}")
-                print(f"⚠️  Please manually check {filename} for transaction accuracy")
+                self._report(f"✗ Validation failed: {filename} - Expected RM{pdf_total_debit:.2f}, got RM{calculated_debit_sum:.2f}")
+                self._report(f"⚠️  Please manually check {filename} for transaction accuracy")
             
             return is_valid
         else:
@@ -592,111 +983,296 @@ class MaybankStatementParser:
                 'pdf_total': None,
                 'difference': None
             })
-            print(f"⚠️  No validation total found in {filename} - please verify transactions manually")
+            self._report(f"⚠️  No validation total found in {filename} - please verify transactions manually")
             return True  # Cannot validate, but don't fail
     
-    def process_all_statements(self) -> List[Dict]:
+    def _process_file(self, pdf_path: str) -> Optional[tuple]:
         """
-        Process all PDF files in the specified folder.
+        Extract, parse and validate a single PDF.
+        Returns (transactions, balance, validation_messages), or None if no text
+        could be extracted.
+        """
+        return self._process_text(pdf_path, self.extract_text_from_pdf(pdf_path))
+    
+    def _process_text(self, pdf_path: str, text: Optional[str]) -> Optional[tuple]:
+        """
+        Parse and validate text already extracted from a PDF.
+        Validation messages are returned rather than reported, so the caller
+        can print them after the file's summary line.
+        """
+        if not text:
+            return None
+        
+        filename = os.path.basename(pdf_path)
+        transactions = self.parse_transactions(text, filename)
+        balance = self.extract_balance_info(text)
+        
+        # Validate debit transactions
+        messages = self._messages
+        self._messages = []
+        try:
+            self.validate_debit_transactions(transactions, text, filename)
+            validation_messages = self._messages
+        finally:
+            self._messages = messages
+        
+        return transactions, balance, validation_messages
+    
+    def _iter_processed_files(self, pdf_paths: List[str]):
+        """
+        Yield (pdf_path, result) for each PDF in order, spreading the work over
+        a process pool when there is more than one file and more than one worker.
+        """
+        max_workers = min(self.max_workers or os.cpu_count() or 1, len(pdf_paths))
+        if max_workers <= 1:
+            yield from self._iter_processed_files_serial(pdf_paths)
+            return
+        
+        if self.interactive:
+            self._collect_passwords(pdf_paths)
+        
+        # Workers get a small immutable snapshot rather than this parser, whose
+        # results and password cache keep changing while tasks are being queued
+        config = _WorkerConfig(
+            statement_type=self.statement_type,
+            backend=self.backend,
+            cache_dir=self.cache_dir,
+            now=self._now,
+            passwords=dict(self.password_cache),
+            common_password=self.common_password if self.use_same_password else None
+        )
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(_process_file_in_worker, repeat(config), pdf_paths)
+            for pdf_path, (result, validation_results, messages, needs_password) in zip(pdf_paths, outcomes):
+                for message in messages:
+                    print(message)
+                if needs_password:
+                    # Workers cannot prompt, so retry here where the user can be asked.
+                    # If the worker was turned away with the password still in effect
+                    # here, drop it so the retry does not spend an attempt on it.
+                    filename = os.path.basename(pdf_path)
+                    rejected = config.passwords.get(filename) or config.common_password
+                    current = self.password_cache.get(filename) or (self.common_password if self.use_same_password else None)
+                    if rejected and rejected == current:
+                        print(f"❌ Failed to decrypt PDF: {filename} - Incorrect password")
+                        self._forget_password(pdf_path)
+                    result = self._process_file(pdf_path)
+                else:
+                    self.validation_results.extend(validation_results)
+                yield pdf_path, result
+    
+    def _iter_processed_files_serial(self, pdf_paths: List[str]):
+        """
+        Process PDFs one at a time, extracting the next file on a background
+        thread while the current one is parsed.
+        """
+        if len(pdf_paths) <= 1:
+            for pdf_path in pdf_paths:
+                yield pdf_path, self._process_file(pdf_path)
+            return
+        
+        # The prefetch thread must not prompt (a blocked prompt would hang Ctrl+C),
+        # so it works on a non-interactive copy that shares this parser's password
+        # state and buffers its messages for the main thread to print in order
+        prefetcher = copy.copy(self)
+        prefetcher.interactive = False
+        prefetcher._password_owner = self
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_text = executor.submit(prefetcher._extract_text_buffered, pdf_paths[0])
+            for index, pdf_path in enumerate(pdf_paths):
+                try:
+                    text, messages = next_text.result()
+                    for message in messages:
+                        print(message)
+                except _PasswordRequired:
+                    # Nothing else is extracting now, so prompting here is safe
+                    text = self.extract_text_from_pdf(pdf_path)
+                
+                if index + 1 < len(pdf_paths):
+                    next_text = executor.submit(prefetcher._extract_text_buffered, pdf_paths[index + 1])
+                
+                yield pdf_path, self._process_text(pdf_path, text)
+    
+    def list_pdfs(self) -> List[str]:
+        """
+        Return the paths of the PDF files in the folder, sorted by filename.
+        """
+        with os.scandir(self.pdf_folder) as entries:
+            pdf_entries = [entry for entry in entries if entry.name.lower().endswith('.pdf') and entry.is_file()]
+        return [entry.path for entry in sorted(pdf_entries, key=lambda entry: entry.name)]
+    
+    def iter_all_transactions(self) -> Iterator[Transaction]:
+        """
+        Process all PDF files in the specified folder, yielding transactions one
+        file at a time so callers do not have to hold the whole batch in memory.
         """
         if not os.path.exists(self.pdf_folder):
             print(f"❌ Folder '{self.pdf_folder}' does not exist.")
-            return []
+            return
         
-        all_transactions = []
         processed_files = 0
+        total_transactions = 0
         
-        pdf_files = [f for f in os.listdir(self.pdf_folder) if f.endswith('.pdf')]
+        pdf_paths = self.list_pdfs()
         
-        if not pdf_files:
+        if not pdf_paths:
             print(f"⚠️  No PDF files found in '{self.pdf_folder}'")
-            return []
+            return
         
-        print(f"📁 Found {len(pdf_files)} PDF files to process...")
+        print(f"📁 Found {len(pdf_paths)} PDF files to process...")
         
-        for filename in sorted(pdf_files):
-            pdf_path = os.path.join(self.pdf_folder, filename)
-            
-            text = self.extract_text_from_pdf(pdf_path)
-            if text:
-                transactions = self.parse_transactions(text, filename)
-                balance = self.extract_balance_info(text)
-                
-                # Create summary message
-                balance_info = f", Balance: RM{balance:.2f}" if balance else ""
-                print(f"✓ {filename}: {len(transactions)} transactions{balance_info}")
-                
-                # Validate debit transactions
-                self.validate_debit_transactions(transactions, text, filename)
+        # Read the clock once for the whole run (workers receive it with the parser)
+        self._now = datetime.now()
+        try:
+            for pdf_path, result in self._iter_processed_files(pdf_paths):
+                filename = os.path.basename(pdf_path)
                 
-                all_transactions.extend(transactions)
-                processed_files += 1
-            else:
-                print(f"✗ Failed to extract text from {filename}")
+                if result is not None:
+                    transactions, balance, validation_messages = result
+                    
+                    # Create summary message
+                    balance_info = f", Balance: RM{balance:.2f}" if balance else ""
+                    print(f"✓ {filename}: {len(transactions)} transactions{balance_info}")
+                    for message in validation_messages:
+                        print(message)
+                    
+                    total_transactions += len(transactions)
+                    processed_files += 1
+                    yield from transactions
+                else:
+                    print(f"✗ Failed to extract text from {filename}")
+        finally:
+            self._now = None
         
         print(f"📊 Processed {processed_files} files successfully.")
-        print(f"📊 Total transactions extracted: {len(all_transactions)}")
-        
-        return all_transactions
+        print(f"📊 Total transactions extracted: {total_transactions}")
+    
+    def process_all_statements(self) -> List[Transaction]:
+        """
+        Process all PDF files in the specified folder.
+        """
+        return list(self.iter_all_transactions())
     
-    def save_to_csv(self, transactions: List[Dict], filename: str = "maybank_transactions.csv"):
+    def save_to_csv(self, transactions: Iterable[Transaction], filename: str = "maybank_transactions.csv"):
         """
         Save transactions to CSV file.
+        Accepts any iterable, e.g. iter_all_transactions(), and writes rows as they arrive.
         """
-        if not transactions:
+        transactions = iter(transactions)
+        first = next(transactions, None)
+        if first is None:
             print("⚠️  No transactions to save to CSV.")
             return
         
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['date', 'posting_date', 'transaction_date', 'description', 'amount', 'type', 'source_file']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer = csv.writer(csvfile)
                 
-                writer.writeheader()
-                for transaction in transactions:
-                    writer.writerow(transaction)
+                # Transactions are tuples in column order, so they are written as rows directly
+                writer.writerow(Transaction._fields)
+                writer.writerow(first)
+                writer.writerows(transactions)
             
             print(f"💾 Transactions saved to {filename}")
         except Exception as e:
             print(f"❌ Error saving to CSV: {e}")
     
-    def save_to_json(self, transactions: List[Dict], filename: str = "maybank_transactions.json"):
+    def save_to_json(self, transactions: Iterable[Transaction], filename: str = "maybank_transactions.json"):
         """
         Save transactions to JSON file.
+        Accepts any iterable and uses orjson when installed.
         """
-        if not transactions:
+        transactions = iter(transactions)
+        first = next(transactions, None)
+        if first is None:
             print("⚠️  No transactions to save to JSON.")
             return
         
         try:
-            with open(filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump(transactions, jsonfile, indent=2, ensure_ascii=False)
+            # Encode one record at a time into a large buffer, so the whole array is never
+            # held in memory and json.dump's many small writes are avoided
+            with open(filename, 'wb', buffering=1 << 20) as jsonfile:
+                separator = b'[\n  '
+                for transaction in chain((first,), transactions):
+                    if orjson is not None:
+                        record = orjson.dumps(transaction._asdict(), option=orjson.OPT_INDENT_2)
+                    else:
+                        record = json.dumps(transaction._asdict(), indent=2, ensure_ascii=False).encode('utf-8')
+                    # Indent the record one level to match a whole-array dump
+                    jsonfile.write(separator + record.replace(b'\n', b'\n  '))
+                    separator = b',\n  '
+                jsonfile.write(b'\n]')
             
             print(f"💾 Transactions saved to {filename}")
         except Exception as e:
             print(f"❌ Error saving to JSON: {e}")
     
-    def print_summary(self, transactions: List[Dict]):
+    def save_to_ndjson(self, transactions: Iterable[Transaction], filename: str = "maybank_transactions.ndjson"):
+        """
+        Save transactions as newline-delimited JSON, one object per line.
+        Uses orjson when installed.
+        """
+        transactions = iter(transactions)
+        first = next(transactions, None)
+        if first is None:
+            print("⚠️  No transactions to save to NDJSON.")
+            return
+        
+        count = 0
+        try:
+            with open(filename, 'wb', buffering=1 << 20) as ndjsonfile:
+                for transaction in chain((first,), transactions):
+                    if orjson is not None:
+                        ndjsonfile.write(orjson.dumps(transaction._asdict()) + b'\n')
+                    else:
+                        ndjsonfile.write(json.dumps(transaction._asdict(), ensure_ascii=False).encode('utf-8') + b'\n')
+                    count += 1
+            
+            print(f"💾 {count} transactions saved to {filename}")
+        except Exception as e:
+            print(f"❌ Error saving to NDJSON: {e}")
+    
+    def print_summary(self, transactions: Iterable[Transaction]):
         """
         Log a summary of extracted transactions.
+        Accepts any iterable and aggregates in a single pass.
         """
-        if not transactions:
+        count = 0
+        totals = {}  # type -> [total amount, transaction count]
+        samples = []
+        
+        for transaction in transactions:
+            count += 1
+            group = totals.get(transaction.type)
+            if group is None:
+                group = totals[transaction.type] = [0.0, 0]
+            group[0] += transaction.amount
+            group[1] += 1
+            if len(samples) < 3:
+                samples.append(transaction)
+        
+        if not count:
             print("⚠️  No transactions found.")
             return
         
-        credit_amount = sum(t['amount'] for t in transactions if t['type'] == 'CREDIT')
-        debit_amount = sum(t['amount'] for t in transactions if t['type'] == 'DEBIT')
-        
-        print(f"📊 Summary: {len(transactions)} transactions | Credits: RM{credit_amount:.2f} | Debits: RM{debit_amount:.2f}")
+        credit_amount, credit_count = totals.get('CREDIT', (0.0, 0))
+        debit_amount, debit_count = totals.get('DEBIT', (0.0, 0))
+        lines = [
+            f"📊 Summary: {count} transactions | Credits: RM{credit_amount:.2f} ({credit_count}) | Debits: RM{debit_amount:.2f} ({debit_count})",
+            "📋 Sample transactions:"
+        ]
         
         # Show sample transactions
-        print("📋 Sample transactions:")
-        for i, transaction in enumerate(transactions[:3]):
-            desc = transaction['description'][:35] + "..." if len(transaction['description']) > 35 else transaction['description']
-            print(f"   {transaction['date']} | {desc:<38} | RM{transaction['amount']:>8.2f}")
+        for transaction in samples:
+            desc = transaction.description[:35] + "..." if len(transaction.description) > 35 else transaction.description
+            lines.append(f"   {transaction.date} | {desc:<38} | RM{transaction.amount:>8.2f}")
+        
+        if count > 3:
+            lines.append(f"   ... and {count - 3} more transactions")
         
-        if len(transactions) > 3:
-            print(f"   ... and {len(transactions) - 3} more transactions")
+        print('\n'.join(lines))
     
     def _get_password_for_file(self, pdf_path: str, attempt: int = 0) -> Optional[str]:
          """
@@ -704,9 +1280,18 @@ class MaybankStatementParser:
          """
          filename = os.path.basename(pdf_path)
          
+         # A prefetch copy reads the password state of the parser it was copied from
+         owner = self._password_owner or self
+         
          # Check if we already have a password for this file
-         if filename in self.password_cache:
-             return self.password_cache[filename]
+         if filename in owner.password_cache:
+             return owner.password_cache[filename]
+         
+         # Worker processes cannot prompt; let the main process handle this file
+         if not self.interactive:
+             if owner.use_same_password and owner.common_password:
+                 return owner.common_password
+             raise _PasswordRequired(filename)
          
          # Check if user wants to use same password for all files
          if self.use_same_password is None:
@@ -752,7 +1337,59 @@ class MaybankStatementParser:
          except Exception as e:
             print(f"❌ Error getting password: {e}")
             return None
+
+    def _needs_password(self, pdf_path: str) -> bool:
+        """
+        Check whether a PDF can only be opened with a user-supplied password
+        (the empty password some Maybank PDFs use does not count).
+        """
+        try:
+            if self.backend == "pypdfium2":
+                try:
+                    pdfium.PdfDocument(pdf_path).close()
+                    return False
+                except pdfium.PdfiumError as e:
+                    return 'password' in str(e).lower()
+            if self.backend == "pymupdf":
+                with fitz.open(pdf_path) as doc:
+                    return bool(doc.needs_pass) and not doc.authenticate("")
+            with open(pdf_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                reader = PyPDF2.PdfReader(mapped)
+                return reader.is_encrypted and not reader.decrypt("")
+        except Exception:
+            # Let extraction report unreadable files
+            return False
+    
+    def _collect_passwords(self, pdf_paths: List[str]):
+        """
+        Prompt for the passwords of all encrypted PDFs up front, so worker
+        processes find them in the password cache instead of handing the file back.
+        Files whose text is already cached are skipped, since they are never opened.
+        """
+        for pdf_path in pdf_paths:
+            filename = os.path.basename(pdf_path)
+            if filename in self.password_cache or (self.use_same_password and self.common_password):
+                continue
+            if self.cache_dir:
+                cache_path = self._text_cache_path(pdf_path)
+                if cache_path and os.path.exists(cache_path):
+                    continue
+            # The prompt names the file; the worker reports the encryption itself
+            if self._needs_password(pdf_path):
+                self._get_password_for_file(pdf_path)
     
+    def _forget_password(self, pdf_path: str):
+        """
+        Drop a rejected password from the cache so the user is prompted again.
+        """
+        owner = self._password_owner or self
+        filename = os.path.basename(pdf_path)
+        if filename in owner.password_cache:
+            del owner.password_cache[filename]
+        # If using same password for all, clear that too
+        if owner.use_same_password:
+            owner.common_password = None
+
     def print_validation_summary(self):
         """
         Print a summary of validation results.
@@ -760,38 +1397,62 @@ class MaybankStatementParser:
         if not self.validation_results:
             return
         
-        print(f"\n🔍 Validation Summary:")
-        print("-" * 80)
-        
         passed = 0
         failed = 0
         no_total = 0
         no_debits = 0
         
+        # Build the report first and print it once rather than once per file
+        lines = ["\n🔍 Validation Summary:", "-" * 80]
+        
         for result in self.validation_results:
             filename = result['filename']
             status = result['status']
             
             if status == 'PASS':
                 passed += 1
-                print(f"   ✅ {filename:<35} PASS    (Diff: RM{result['difference']:.2f})")
+                lines.append(f"   ✅ {filename:<35} PASS    (Diff: RM{result['difference']:.2f})")
             elif status == 'FAIL':
                 failed += 1
-                print(f"   ❌ {filename:<35} FAIL    (Expected: RM{result['pdf_total']:.2f}, Got: RM{result['calculated_sum']:.2f})")
+                lines.append(f"   ❌ {filename:<35} FAIL    (Expected: RM{result['pdf_total']:.2f}, Got: RM{result['calculated_sum']:.2f})")
             elif status == 'NO_TOTAL':
                 no_total += 1
-                print(f"   ⚠️  {filename:<35} NO_TOTAL (Cannot validate - no PDF total found)")
+                lines.append(f"   ⚠️  {filename:<35} NO_TOTAL (Cannot validate - no PDF total found)")
             elif status == 'NO_DEBITS':
                 no_debits += 1
-                print(f"   ℹ️  {filename:<35} NO_DEBITS (No debit transactions found)")
+                lines.append(f"   ℹ️  {filename:<35} NO_DEBITS (No debit transactions found)")
         
-        print("-" * 80)
-        print(f"   📊 Summary: {passed} passed, {failed} failed, {no_total} no total, {no_debits} no debits")
+        lines.append("-" * 80)
+        lines.append(f"   📊 Summary: {passed} passed, {failed} failed, {no_total} no total, {no_debits} no debits")
         
         if failed > 0:
-            print(f"   ⚠️  {failed} file(s) failed validation - please review manually")
+            lines.append(f"   ⚠️  {failed} file(s) failed validation - please review manually")
         elif passed > 0:
-            print(f"   ✅ All {passed} file(s) passed validation!")
+            lines.append(f"   ✅ All {passed} file(s) passed validation!")
+        
+        print('\n'.join(lines))
+
+
+def _process_file_in_worker(config: _WorkerConfig, pdf_path: str):
+    """
+    Process one PDF in a worker process with a parser built from config.
+    Messages are buffered and returned so the main process prints them in order.
+    Returns (result, validation_results, messages, needs_password).
+    """
+    parser = MaybankStatementParser(statement_type=config.statement_type, backend=config.backend,
+                                    cache_dir=config.cache_dir)
+    parser.interactive = False
+    parser._now = config.now
+    parser.password_cache = dict(config.passwords)
+    if config.common_password:
+        parser.use_same_password = True
+        parser.common_password = config.common_password
+    parser._messages = []
+    try:
+        return parser._process_file(pdf_path), parser.validation_results, parser._messages, False
+    except _PasswordRequired:
+        # The main process extracts this file again, so its messages would repeat
+        return None, [], [], True
 
 
 def get_user_statement_type() -> StatementType:
@@ -824,20 +1485,70 @@ def get_user_statement_type() -> StatementType:
         except Exception as e:
             print(f"❌ Error: {e}. Please try again.")
 
-def main():
+
+_OUTPUT_FORMATS = ('csv', 'json', 'ndjson')
+
+
+def _positive_int(value: str) -> int:
+    """
+    argparse type for options that must be a whole number of at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line options. With no options the parser runs interactively.
+    """
+    arg_parser = argparse.ArgumentParser(description="Extract transactions from Maybank PDF statements.")
+    arg_parser.add_argument('--type', choices=[StatementType.CREDIT_CARD.value, StatementType.CURRENT_ACCOUNT.value],
+                            help="statement type (skips the interactive prompt)")
+    arg_parser.add_argument('--folder', default="./Drop", help="folder containing the PDF statements (default: ./Drop)")
+    arg_parser.add_argument('--formats', default="csv,json",
+                            help="comma-separated output formats: csv, json, ndjson (default: csv,json)")
+    arg_parser.add_argument('--workers', type=_positive_int, default=None,
+                            help="number of worker processes (default: CPU count, 1 disables parallelism)")
+    arg_parser.add_argument('--backend', choices=["pypdfium2", "pymupdf", "pypdf2"], default=None,
+                            help="PDF text extraction backend (default: pypdfium2, else the first installed)")
+    arg_parser.add_argument('--cache-dir', default=None,
+                            help="cache extracted text in this folder (stores decrypted statement text)")
+    args = arg_parser.parse_args(argv)
+    
+    # Turn the format list into a set, rejecting names that would silently write nothing
+    args.formats = {fmt.strip().lower() for fmt in args.formats.split(',') if fmt.strip()}
+    unknown_formats = sorted(args.formats.difference(_OUTPUT_FORMATS))
+    if unknown_formats:
+        arg_parser.error(f"unknown output format(s): {', '.join(unknown_formats)} (choose from {', '.join(_OUTPUT_FORMATS)})")
+    if not args.formats:
+        arg_parser.error("at least one output format is required")
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Main function to run the Maybank statement parser.
     """
+    args = parse_args(argv)
+    formats = args.formats
+    
     try:
         # Get user's statement type preference
-        statement_type = get_user_statement_type()
+        statement_type = StatementType(args.type) if args.type else get_user_statement_type()
         
         # Initialize parser with selected statement type
-        parser = MaybankStatementParser(statement_type=statement_type)
+        parser = MaybankStatementParser(pdf_folder=args.folder, statement_type=statement_type,
+                                        backend=args.backend, max_workers=args.workers,
+                                        cache_dir=args.cache_dir)
         
         print("\n" + "="*60)
         print("🚀 Starting Maybank PDF Statement Parser...")
-        print("📁 Processing PDFs from: ./Drop/")
+        print(f"📁 Processing PDFs from: {args.folder}")
         
         print("\n⚠️  Note: Unexpected formats will trigger warnings")
         print("-"*60)
@@ -854,21 +1565,30 @@ def main():
             parser.print_summary(transactions)
             
             # Save to files
-            parser.save_to_csv(transactions)
-            parser.save_to_json(transactions)
+            saved_files = []
+            if 'csv' in formats:
+                parser.save_to_csv(transactions)
+                saved_files.append("maybank_transactions.csv")
+            if 'json' in formats:
+                parser.save_to_json(transactions)
+                saved_files.append("maybank_transactions.json")
+            if 'ndjson' in formats:
+                parser.save_to_ndjson(transactions)
+                saved_files.append("maybank_transactions.ndjson")
             
             # Print validation summary
             parser.print_validation_summary()
             
             print("\n" + "="*60)
             print("✅ Processing completed successfully!")
-            print("📄 Files saved: maybank_transactions.csv, maybank_transactions.json")
+            if saved_files:
+                print(f"📄 Files saved: {', '.join(saved_files)}")
             print("="*60)
         else:
             print("\n" + "="*60)
             print("❌ No transactions extracted.")
             print("\n💡 Troubleshooting tips:")
-            print("   • Check if PDF files are in the ./Drop/ folder")
+            print(f"   • Check if PDF files are in the {args.folder} folder")
             print("   • Verify PDFs are valid Maybank statements")
             print("   • Try different statement type if auto-detect failed")
             print("="*60)